@@ -0,0 +1,72 @@
+"""
+_clients.py - Shared Cloud Clients for the Budget-Aware AI Squad
+
+=============================================================================
+SHARED CLIENTS: ONE CONNECTION POOL PER ENDPOINT
+=============================================================================
+
+Building a boto3 client is expensive: botocore loads the service model,
+resolves endpoints and sets up request signing every time. Agents are
+cheap to create, so they share one S3 client per endpoint from this module
+instead of building their own.
+
+boto3 clients are thread-safe, so a single instance can serve every agent
+and every worker thread in the process.
+
+=============================================================================
+"""
+
+import functools
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+
+# =============================================================================
+# LOCALSTACK CONFIGURATION
+# =============================================================================
+
+# Sized for agents that fan uploads out over a thread pool
+S3_MAX_POOL_CONNECTIONS = 32
+
+# TCP keep-alive (SO_KEEPALIVE) probes idle pooled sockets, so a connection
+# silently dropped by the peer or a middlebox is detected instead of
+# surfacing as a hung or failed request when it is next reused
+S3_CONFIG = Config(
+    signature_version='s3v4',
+    retries={'mode': 'standard', 'max_attempts': 3},
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True
+)
+
+# Bodies above this size are uploaded as parallel multipart chunks rather
+# than one blocking PUT (5 MiB is the smallest part S3 accepts)
+S3_MULTIPART_THRESHOLD = 5 * 1024 * 1024
+
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=S3_MULTIPART_THRESHOLD,
+    max_concurrency=4
+)
+
+
+@functools.lru_cache(maxsize=4)
+def get_s3_client(endpoint_url: str):
+    """
+    Return the shared S3 client for an endpoint, building it on first use.
+
+    Args:
+        endpoint_url: The S3/LocalStack endpoint (e.g. http://localhost:4566)
+
+    Returns:
+        The boto3 S3 client configured for LocalStack
+    """
+    return boto3.client(
+        's3',
+        endpoint_url=endpoint_url,
+        aws_access_key_id='test',           # LocalStack default
+        aws_secret_access_key='test',       # LocalStack default
+        region_name='us-east-1',
+        config=S3_CONFIG
+    )
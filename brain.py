@@ -33,32 +33,103 @@ is simulated. This is fiscal self-awareness at the agent level.
 =============================================================================
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import statistics
+import threading
+import time
+import httpx
 import ollama
-from dataclasses import dataclass
-from typing import Optional
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Iterator, NamedTuple, Optional, Sequence
 
 
 # Cost simulation constants (based on typical LLM pricing models)
 COST_PER_1K_TOKENS = 0.015  # $0.015 per 1,000 tokens
 CHARS_PER_TOKEN = 4  # Approximate: 1 token ≈ 4 characters
 
+# CHARS_PER_TOKEN is a power of two, so estimating tokens is a right shift
+_TOKEN_SHIFT = CHARS_PER_TOKEN.bit_length() - 1
+if CHARS_PER_TOKEN != 1 << _TOKEN_SHIFT:
+    raise ValueError("CHARS_PER_TOKEN must be a power of two")
+
+# The ledger counts cost in integer units of $0.00000001 so that running
+# totals are exact; dollars are only produced at the API boundary
+_COST_UNITS_PER_DOLLAR = 10**8
+_COST_UNITS_PER_TOKEN = round(COST_PER_1K_TOKENS * _COST_UNITS_PER_DOLLAR / 1000)  # 1500
+
 # Ollama configuration
 OLLAMA_HOST = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.1"
 
+# Concurrent requests the Ollama server will serve per model; mirrors the
+# server-side OLLAMA_NUM_PARALLEL setting
+OLLAMA_NUM_PARALLEL = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
+
+# Connection pool shared by every brain talking to the same Ollama server
+OLLAMA_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Seconds a successful connection check is trusted before re-checking
+CONNECTION_CHECK_TTL = 30.0
+
+# Number of recent Ollama calls kept for latency statistics
+LATENCY_LOG_SIZE = 1024
 
-@dataclass
+# Number of distinct (model, system message, prompt) responses kept in memory
+RESPONSE_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """
     Structured response from the LLM Brain.
     
     Encapsulates both the content and the fiscal metadata required
-    for budget-aware agent operations.
+    for budget-aware agent operations. `cached_tokens` is the part of
+    `estimated_tokens` served from cache rather than recomputed; a fully
+    replayed response has a `simulated_cost` of zero.
     """
     text: str
     estimated_tokens: int
     simulated_cost: float
     model: str
+    cached_tokens: int = 0
+
+
+class BatchParseError(ValueError):
+    """
+    A row-marshaled reply could not be split into one answer per task.
+    
+    The call was still made and billed; `response` holds the unsplit
+    reply with its tokens and cost, so callers can account for it.
+    """
+    
+    def __init__(self, message: str, response: LLMResponse):
+        super().__init__(message)
+        self.response = response
+
+
+class FiscalSummary(NamedTuple):
+    """
+    Snapshot of an LLM Brain's fiscal ledger.
+    
+    Polled by the Accountant Agent, so it is a lightweight tuple with
+    named fields rather than a dict.
+    """
+    total_tokens_used: int
+    total_cost_incurred: float
+    cached_tokens: int
+    cached_prefix_tokens: int
+    rolling_p95_latency: float
+    cost_per_1k_tokens: float
+    model: str
 
 
 class LLMBrain:
@@ -87,25 +158,82 @@ class LLMBrain:
         host (str): The Ollama server endpoint
         total_tokens_used (int): Running total of tokens consumed
         total_cost_incurred (float): Running total of simulated costs
+        cached_tokens (int): Tokens replayed from the response cache
+        cached_prefix_tokens (int): Input tokens from reused system messages
     """
     
-    def __init__(self, model: str = DEFAULT_MODEL, host: str = OLLAMA_HOST):
+    __slots__ = (
+        "model",
+        "host",
+        "total_tokens_used",
+        "_total_cost_units",
+        "cache_size",
+        "cached_tokens",
+        "_response_cache",
+        "cached_prefix_tokens",
+        "_seen_prefixes",
+        "_lock",
+        "_in_flight",
+        "_latency_log",
+        "_executor",
+        "_last_conn_check",
+        "_session_ready",
+        "_local",
+        "_client",
+    )
+    
+    def __init__(
+        self, 
+        model: str = DEFAULT_MODEL, 
+        host: str = OLLAMA_HOST,
+        cache_size: int = RESPONSE_CACHE_SIZE
+    ):
         """
         Initialize the LLM Brain.
         
         Args:
             model: The Ollama model identifier (default: llama3.1)
             host: The Ollama server URL (default: http://localhost:11434)
+            cache_size: Responses kept for replay of identical requests
+                (0 disables the response cache)
         """
         self.model = model
         self.host = host
         
         # Fiscal tracking - the ledger for our budget-aware system
         self.total_tokens_used: int = 0
-        self.total_cost_incurred: float = 0.0
+        self._total_cost_units: int = 0
+        
+        # Replay cache - identical requests are answered without an LLM call
+        self.cache_size = cache_size
+        self.cached_tokens: int = 0
+        self._response_cache: OrderedDict[bytes, LLMResponse] = OrderedDict()
+        
+        # Shared-prefix tracking - system messages reused across calls
+        self.cached_prefix_tokens: int = 0
+        self._seen_prefixes: dict[str, int] = {}
+        
+        # Latency telemetry - (latency, input_tokens, output_tokens,
+        # start_time, queue_depth) for the most recent Ollama calls
+        self._lock = threading.Lock()
+        self._in_flight: int = 0
+        self._latency_log: deque[tuple[float, int, int, float, int]] = deque(maxlen=LATENCY_LOG_SIZE)
+        
+        # Worker pool for fire-and-forget calls (threads start on first use)
+        self._executor = ThreadPoolExecutor(
+            max_workers=OLLAMA_NUM_PARALLEL,
+            thread_name_prefix="llm-brain"
+        )
         
-        # Configure ollama client
-        self._client = ollama.Client(host=self.host)
+        # Monotonic time of the last successful connection check
+        self._last_conn_check: float = float("-inf")
+        self._session_ready: bool = False
+        
+        # Per-thread preallocated chat message templates
+        self._local = threading.local()
+        
+        # Reuse the process-wide ollama client (and its keep-alive pool)
+        self._client = _get_shared_client(self.host)
     
     def calculate_simulated_cost(self, text: str) -> tuple[int, float]:
         """
@@ -133,13 +261,35 @@ class LLMBrain:
             >>> print(f"{tokens} tokens = ${cost:.6f}")
             3 tokens = $0.000045
         """
-        # Estimate tokens: ~1 token per 4 characters
-        estimated_tokens = max(1, len(text) // CHARS_PER_TOKEN)
+        return _estimate_cost(len(text))
+    
+    def calculate_simulated_cost_batch(
+        self, 
+        texts: list[str]
+    ) -> tuple[list[int], list[float]]:
+        """
+        Estimate token counts and simulated costs for many texts at once.
         
-        # Calculate cost: $0.015 per 1k tokens
-        simulated_cost = (estimated_tokens / 1000) * COST_PER_1K_TOKENS
+        Equivalent to calling `calculate_simulated_cost` on each text, but
+        with the per-call method dispatch hoisted out of the loop. Used when
+        costing row-marshaled batches and for bulk audits of past messages.
         
-        return estimated_tokens, simulated_cost
+        Args:
+            texts: The texts to analyze
+            
+        Returns:
+            tuple: (estimated_tokens, simulated_costs), one entry per text
+            
+        Example:
+            >>> brain = LLMBrain()
+            >>> tokens, costs = brain.calculate_simulated_cost_batch(["Hi", "Hello world!"])
+            >>> tokens
+            [1, 3]
+        """
+        tokens = [(len(text) >> _TOKEN_SHIFT) or 1 for text in texts]
+        costs = [count * _COST_UNITS_PER_TOKEN / _COST_UNITS_PER_DOLLAR for count in tokens]
+        
+        return tokens, costs
     
     def generate_response(
         self, 
@@ -165,6 +315,11 @@ class LLMBrain:
         Returns:
             LLMResponse: Structured response with text and fiscal metadata
             
+        Identical requests (same model, system message and prompt) are
+        replayed from an in-memory LRU cache without calling Ollama; the
+        replayed tokens are counted in `cached_tokens` rather than billed,
+        and the replay reports a `simulated_cost` of zero.
+        
         Raises:
             ConnectionError: If Ollama server is unreachable
             
@@ -177,52 +332,491 @@ class LLMBrain:
             >>> print(response.text)
             >>> print(f"This cost: ${response.simulated_cost:.6f}")
         """
-        # Build message list for Ollama
-        messages = []
+        key = self._cache_key(prompt, system_message)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
         
-        if system_message:
-            messages.append({
-                "role": "system",
-                "content": system_message
-            })
+        messages = self._build_messages(prompt, system_message)
         
-        messages.append({
-            "role": "user", 
-            "content": prompt
-        })
+        # Call Ollama (local execution - no cloud cost!)
+        started = self._begin_call()
+        try:
+            response = self._client.chat(
+                model=self.model,
+                messages=messages
+            )
+        finally:
+            self._end_call()
         
-        # Calculate input cost (prompt + system message)
-        input_text = (system_message or "") + prompt
-        input_tokens, input_cost = self.calculate_simulated_cost(input_text)
+        result = self._record_response(
+            prompt, system_message, response["message"]["content"], started, response
+        )
+        return self._cache_store(key, result)
+    
+    def submit_response(
+        self, 
+        prompt: str, 
+        system_message: Optional[str] = None
+    ) -> "Future[LLMResponse]":
+        """
+        Run `generate_response` on the brain's worker pool.
         
-        # Call Ollama (local execution - no cloud cost!)
-        response = self._client.chat(
-            model=self.model,
-            messages=messages
+        Returns immediately so that several agents can have requests in
+        flight at once from synchronous code; their HTTP round-trips then
+        overlap instead of running back to back. The pool is sized by the
+        OLLAMA_NUM_PARALLEL environment variable (default 4).
+        
+        Args:
+            prompt: The user/agent prompt to send to the LLM
+            system_message: Optional system context for the LLM
+            
+        Returns:
+            Future[LLMResponse]: Resolves to the structured response
+            
+        Example:
+            >>> brain = LLMBrain()
+            >>> futures = [brain.submit_response(p) for p in ("What is S3?", "What is EC2?")]
+            >>> responses = [f.result() for f in futures]
+        """
+        return self._executor.submit(self.generate_response, prompt, system_message)
+    
+    async def agenerate_response(
+        self, 
+        prompt: str, 
+        system_message: Optional[str] = None
+    ) -> LLMResponse:
+        """
+        Asynchronous counterpart of `generate_response`.
+        
+        Uses `ollama.AsyncClient` so that the caller's event loop is free
+        while Ollama computes the response. Fiscal tracking is identical to
+        the synchronous path.
+        
+        Args:
+            prompt: The user/agent prompt to send to the LLM
+            system_message: Optional system context for the LLM
+            
+        Returns:
+            LLMResponse: Structured response with text and fiscal metadata
+        """
+        key = self._cache_key(prompt, system_message)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        messages = self._build_messages(prompt, system_message)
+        
+        started = self._begin_call()
+        try:
+            async with _async_client(self.host) as client:
+                response = await client.chat(
+                    model=self.model,
+                    messages=messages
+                )
+        finally:
+            self._end_call()
+        
+        result = self._record_response(
+            prompt, system_message, response["message"]["content"], started, response
         )
+        return self._cache_store(key, result)
+    
+    async def agenerate_batch(
+        self, 
+        prompts: Sequence[tuple[str, Optional[str]]],
+        max_concurrent: Optional[int] = None
+    ) -> list[LLMResponse]:
+        """
+        Issue several (prompt, system_message) requests concurrently.
+        
+        Requests overlap, so wall-clock latency drops from the sum of the
+        per-call latencies towards the slowest call. How many requests
+        Ollama actually serves in parallel is controlled on the server side:
+        
+            OLLAMA_NUM_PARALLEL       Concurrent requests per loaded model
+            OLLAMA_MAX_LOADED_MODELS  Models kept in memory simultaneously
         
-        # Extract response text
-        response_text = response["message"]["content"]
+        Sending more than OLLAMA_NUM_PARALLEL at once gains nothing - the
+        extras just queue on the server while holding connections - so at
+        most `max_concurrent` requests are in flight at a time.
+        
+        Args:
+            prompts: List of (prompt, system_message) pairs
+            max_concurrent: Cap on in-flight requests
+                (default: OLLAMA_NUM_PARALLEL)
+            
+        Returns:
+            list[LLMResponse]: Responses in the same order as `prompts`
+            
+        Example:
+            >>> brain = LLMBrain()
+            >>> responses = asyncio.run(brain.agenerate_batch([
+            ...     ("What is S3?", "Be concise."),
+            ...     ("What is EC2?", "Be concise."),
+            ... ]))
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or OLLAMA_NUM_PARALLEL)
+        
+        async def _one(prompt: str, system_message: Optional[str]) -> LLMResponse:
+            async with semaphore:
+                return await self.agenerate_response(prompt, system_message)
+        
+        # One client (and connection pool) serves the whole batch and is
+        # closed with it, so repeated asyncio.run() calls leak nothing
+        async with _async_client_scope(self.host):
+            return list(await asyncio.gather(*(
+                _one(prompt, system_message) for prompt, system_message in prompts
+            )))
+    
+    async def agenerate_many(
+        self, 
+        prompts: Sequence[str], 
+        system_message: Optional[str] = None,
+        max_concurrent: Optional[int] = None
+    ) -> list[LLMResponse]:
+        """
+        Answer many prompts that share one system message, concurrently.
+        
+        Convenience form of `agenerate_batch` with the same concurrency cap.
+        
+        Args:
+            prompts: The user/agent prompts to answer
+            system_message: Optional system context shared by every prompt
+            max_concurrent: Cap on in-flight requests
+                (default: OLLAMA_NUM_PARALLEL)
+            
+        Returns:
+            list[LLMResponse]: Responses in the same order as `prompts`
+        """
+        return await self.agenerate_batch(
+            [(prompt, system_message) for prompt in prompts],
+            max_concurrent
+        )
+    
+    def generate_response_stream(
+        self, 
+        prompt: str, 
+        system_message: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response from the local Ollama LLM as it is generated.
+        
+        Yields text fragments as soon as Ollama produces them, so callers can
+        start downstream work before the last token arrives. The interaction
+        is posted to the fiscal ledger once the stream ends - including when
+        the caller stops iterating early, in which case only the fragments
+        received so far are billed as output. A stream that fails before
+        its first chunk arrives is not billed at all.
+        
+        Streamed responses bypass the response cache.
+        
+        Args:
+            prompt: The user/agent prompt to send to the LLM
+            system_message: Optional system context for the LLM
+            
+        Yields:
+            str: Successive fragments of the response text
+            
+        Example:
+            >>> brain = LLMBrain()
+            >>> for fragment in brain.generate_response_stream("What is EC2?"):
+            ...     print(fragment, end="", flush=True)
+        """
+        fragments: list[str] = []
+        chunk = None
+        started = self._begin_call()
+        try:
+            stream = self._client.chat(
+                model=self.model,
+                messages=self._build_messages(prompt, system_message),
+                stream=True
+            )
+            for chunk in stream:
+                fragment = chunk["message"]["content"]
+                fragments.append(fragment)
+                yield fragment
+        finally:
+            self._end_call()
+            # Nothing is billed unless Ollama answered (the client opens the
+            # stream lazily, so a dead server fails on the first chunk);
+            # otherwise the final chunk carries Ollama's token counts
+            if chunk is not None:
+                self._record_response(prompt, system_message, "".join(fragments), started, chunk)
+    
+    async def agenerate_response_stream(
+        self, 
+        prompt: str, 
+        system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronous counterpart of `generate_response_stream`.
+        
+        Args:
+            prompt: The user/agent prompt to send to the LLM
+            system_message: Optional system context for the LLM
+            
+        Yields:
+            str: Successive fragments of the response text
+        """
+        fragments: list[str] = []
+        chunk = None
+        started = self._begin_call()
+        try:
+            async with _async_client(self.host) as client:
+                stream = await client.chat(
+                    model=self.model,
+                    messages=self._build_messages(prompt, system_message),
+                    stream=True
+                )
+                async for chunk in stream:
+                    fragment = chunk["message"]["content"]
+                    fragments.append(fragment)
+                    yield fragment
+        finally:
+            self._end_call()
+            # Nothing is billed unless Ollama answered (the client opens the
+            # stream lazily, so a dead server fails on the first chunk);
+            # otherwise the final chunk carries Ollama's token counts
+            if chunk is not None:
+                self._record_response(prompt, system_message, "".join(fragments), started, chunk)
+    
+    def generate_batched(
+        self, 
+        prompts: list[str], 
+        system_message: Optional[str] = None,
+        batch_size: int = 8
+    ) -> list[LLMResponse]:
+        """
+        Answer many prompts using one Ollama chat call per `batch_size` prompts.
+        
+        Prompts are row-marshaled: up to `batch_size` of them are packed into
+        a single user message, delimited by `---TASK i---` markers, and the
+        model is asked to reply with a JSON array holding one answer per
+        task. This trades per-call HTTP overhead for a longer prompt; tune
+        `batch_size` to find the sweet spot for the model in use.
+        
+        The tokens and cost of each combined call are attributed back to the
+        individual prompts in proportion to their length.
+        
+        Args:
+            prompts: The user/agent prompts to answer
+            system_message: Optional system context shared by every prompt
+            batch_size: Maximum number of prompts packed into one call
+            
+        Returns:
+            list[LLMResponse]: One response per prompt, in input order
+            
+        Raises:
+            BatchParseError: If the model's reply is not a JSON array with
+                one answer per task (the failed call is already billed)
+            ValueError: If `batch_size` is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        responses: list[LLMResponse] = []
+        for start in range(0, len(prompts), batch_size):
+            chunk = prompts[start:start + batch_size]
+            responses.extend(self._generate_chunk(chunk, system_message))
+        
+        return responses
+    
+    def _generate_chunk(
+        self, 
+        prompts: list[str], 
+        system_message: Optional[str]
+    ) -> list[LLMResponse]:
+        """Send one row-marshaled chat call and split the reply per prompt."""
+        count = len(prompts)
+        tasks = "\n\n".join(
+            f"---TASK {i}---\n{prompt}" for i, prompt in enumerate(prompts, 1)
+        )
+        combined_prompt = (
+            f"You will receive {count} tasks delimited by ---TASK i--- markers. "
+            f"Respond with a JSON array of {count} strings, one answer per task, "
+            f"in task order, and nothing else.\n\n{tasks}"
+        )
+        
+        started = self._begin_call()
+        try:
+            response = self._client.chat(
+                model=self.model,
+                messages=self._build_messages(combined_prompt, system_message)
+            )
+        finally:
+            self._end_call()
+        
+        combined = self._record_response(
+            combined_prompt, system_message, response["message"]["content"], started, response
+        )
+        try:
+            answers = _parse_answer_array(combined.text, count)
+        except ValueError as e:
+            raise BatchParseError(str(e), combined) from e
+        
+        # Attribute tokens and cost to each prompt by its share of the input
+        prompt_tokens, _ = self.calculate_simulated_cost_batch(prompts)
+        total_prompt_tokens = sum(prompt_tokens)
+        results = []
+        tokens_left = combined.estimated_tokens
+        for i, (tokens_in, answer) in enumerate(zip(prompt_tokens, answers)):
+            if i == count - 1:
+                tokens = tokens_left
+            else:
+                tokens = combined.estimated_tokens * tokens_in // total_prompt_tokens
+                tokens_left -= tokens
+            results.append(LLMResponse(
+                text=answer,
+                estimated_tokens=tokens,
+                simulated_cost=tokens * _COST_UNITS_PER_TOKEN / _COST_UNITS_PER_DOLLAR,
+                model=self.model
+            ))
+        
+        return results
+    
+    def _cache_key(self, prompt: str, system_message: Optional[str]) -> bytes:
+        """Hash a request into a compact response-cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model, system_message or "", prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+    
+    def _cache_lookup(self, key: bytes) -> Optional[LLMResponse]:
+        """
+        Replay a cached response, crediting its tokens to `cached_tokens`.
+        
+        Nothing is spent on a replay, so its `simulated_cost` is zero.
+        """
+        with self._lock:
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            
+            self._response_cache.move_to_end(key)
+            self.cached_tokens += cached.estimated_tokens
+        return replace(cached, simulated_cost=0.0, cached_tokens=cached.estimated_tokens)
+    
+    def _cache_store(self, key: bytes, response: LLMResponse) -> LLMResponse:
+        """Remember a fresh response, evicting the least recently used one."""
+        if self.cache_size > 0:
+            with self._lock:
+                self._response_cache[key] = replace(response)
+                if len(self._response_cache) > self.cache_size:
+                    self._response_cache.popitem(last=False)
+        return response
+    
+    def _build_messages(self, prompt: str, system_message: Optional[str]) -> list[dict]:
+        """
+        Fill in the Ollama chat message list for a prompt.
+        
+        The list and its message dicts are preallocated per thread and
+        mutated in place, so the returned list is only valid until the next
+        call on the same thread. That is safe because ollama copies the
+        messages into its own request models as soon as `chat()` starts,
+        before the coroutine of an async call can yield to another task.
+        """
+        templates = getattr(self._local, "messages", None)
+        if templates is None:
+            system = {"role": "system", "content": ""}
+            user = {"role": "user", "content": ""}
+            templates = self._local.messages = ([system, user], [user])
+        
+        with_system, user_only = templates
+        user_only[0]["content"] = prompt
+        
+        if system_message:
+            with_system[0]["content"] = system_message
+            return with_system
+        return user_only
+    
+    def _begin_call(self) -> tuple[float, int]:
+        """Mark an Ollama call as in flight; returns (start time, queue depth)."""
+        with self._lock:
+            self._in_flight += 1
+            return time.perf_counter(), self._in_flight
+    
+    def _end_call(self) -> None:
+        """Mark an Ollama call as no longer in flight."""
+        with self._lock:
+            self._in_flight -= 1
+    
+    def _record_response(
+        self, 
+        prompt: str, 
+        system_message: Optional[str], 
+        response_text: str,
+        started: tuple[float, int],
+        usage=None
+    ) -> LLMResponse:
+        """
+        Cost an Ollama chat response and post it to the fiscal ledger.
+        
+        Shared by the synchronous, asynchronous and streaming generation
+        paths so that every token is accounted for the same way. The call's
+        latency is logged alongside its token counts.
+        
+        Token counts reported by Ollama (`prompt_eval_count` / `eval_count`
+        on `usage`, the chat response or final stream chunk) are exact and
+        preferred; the ~4 characters per token estimate is only used for
+        counts the server did not report.
+        """
+        latency = time.perf_counter() - started[0]
+        
+        # Calculate input cost (prompt + system message) from their lengths,
+        # without concatenating them into a throwaway string
+        sys_len = self._measure_prefix(system_message)
+        input_tokens = _reported_count(usage, "prompt_eval_count") or _estimate_tokens(sys_len + len(prompt))
         
         # Calculate output cost
-        output_tokens, output_cost = self.calculate_simulated_cost(response_text)
+        output_tokens = _reported_count(usage, "eval_count") or _estimate_tokens(len(response_text))
         
-        # Total cost for this interaction
+        # Total cost for this interaction, in exact integer cost units
         total_tokens = input_tokens + output_tokens
-        total_cost = input_cost + output_cost
+        cost_units = total_tokens * _COST_UNITS_PER_TOKEN
         
-        # Update the fiscal ledger
-        self.total_tokens_used += total_tokens
-        self.total_cost_incurred += total_cost
+        # Update the fiscal ledger and latency log
+        with self._lock:
+            self.total_tokens_used += total_tokens
+            self._total_cost_units += cost_units
+            self._latency_log.append(
+                (latency, input_tokens, output_tokens, started[0], started[1])
+            )
         
         return LLMResponse(
             text=response_text,
             estimated_tokens=total_tokens,
-            simulated_cost=total_cost,
+            simulated_cost=cost_units / _COST_UNITS_PER_DOLLAR,
             model=self.model
         )
     
-    def get_fiscal_summary(self) -> dict:
+    def _measure_prefix(self, system_message: Optional[str]) -> int:
+        """
+        Return the length of a system message, tracking prefix reuse.
+        
+        Agent personas are immutable and sent with every call. The first
+        time a persona is seen it is remembered; every later call that
+        shares it credits its tokens to `cached_prefix_tokens`, the portion
+        of the input a prompt-caching backend would bill at a reduced rate.
+        """
+        if not system_message:
+            return 0
+        
+        with self._lock:
+            prefix_tokens = self._seen_prefixes.get(system_message)
+            if prefix_tokens is None:
+                self._seen_prefixes[system_message] = len(system_message) >> _TOKEN_SHIFT
+            else:
+                self.cached_prefix_tokens += prefix_tokens
+        return len(system_message)
+    
+    @property
+    def total_cost_incurred(self) -> float:
+        """Running total of simulated costs, in dollars."""
+        return self._total_cost_units / _COST_UNITS_PER_DOLLAR
+    
+    def get_fiscal_summary(self) -> FiscalSummary:
         """
         Get the current fiscal state of this LLM Brain instance.
         
@@ -230,40 +824,261 @@ class LLMBrain:
         determine if circuit breaker thresholds have been reached.
         
         Returns:
-            dict: Fiscal summary with tokens used and costs incurred
+            FiscalSummary: Fiscal summary with tokens used and costs incurred
+        """
+        return FiscalSummary(
+            self.total_tokens_used,
+            self.total_cost_incurred,
+            self.cached_tokens,
+            self.cached_prefix_tokens,
+            self.get_latency_stats()["p95"],
+            COST_PER_1K_TOKENS,
+            self.model
+        )
+    
+    def get_latency_stats(self) -> dict:
+        """
+        Summarize the latency of recent Ollama calls.
+        
+        The Accountant can watch p95 latency as a contention signal: when it
+        climbs past a threshold, switching callers to `generate_batched`
+        trades many round-trips for one.
+        
+        Returns:
+            dict: p50/p95/p99 latency in seconds over the last
+                LATENCY_LOG_SIZE calls, the sample count, and the peak
+                number of concurrent in-flight calls (0.0s with no samples)
         """
+        with self._lock:
+            samples = list(self._latency_log)
+        
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "samples": 0, "peak_queue_depth": 0}
+        
+        latencies = [sample[0] for sample in samples]
+        if len(latencies) == 1:
+            p50 = p95 = p99 = latencies[0]
+        else:
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        
         return {
-            "total_tokens_used": self.total_tokens_used,
-            "total_cost_incurred": self.total_cost_incurred,
-            "cost_per_1k_tokens": COST_PER_1K_TOKENS,
-            "model": self.model
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "samples": len(samples),
+            "peak_queue_depth": max(sample[4] for sample in samples),
         }
     
-    def check_connection(self) -> bool:
+    def ensure_session(self) -> bool:
+        """
+        Warm up the Ollama session ahead of the first real request.
+        
+        Opens the pooled connection and asks Ollama to load the model into
+        memory (a chat request with no messages does exactly that), so the
+        first paid call does not also pay for the model load. Intended to
+        run in the background while the agent does other I/O; it only does
+        work once per brain and never raises.
+        
+        Returns:
+            bool: True if the session is ready, False if warm-up failed
+        """
+        if self._session_ready:
+            return True
+        
+        try:
+            self._client.chat(model=self.model, messages=[])
+            self._session_ready = True
+        except Exception:
+            return False
+        return True
+    
+    def check_connection(self, ttl: float = CONNECTION_CHECK_TTL) -> bool:
         """
         Verify that the Ollama server is reachable and responsive.
         
+        A successful check is remembered for `ttl` seconds, so agents can
+        use this as a cheap pre-flight health check before every call
+        without paying for a model-listing round-trip each time. Failures
+        are never cached.
+        
+        Args:
+            ttl: Seconds a successful check stays valid (0 always re-checks)
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
+        now = time.monotonic()
+        if now - self._last_conn_check < ttl:
+            return True
+        
         try:
             # List models to verify connection
             self._client.list()
+            self._last_conn_check = now
             return True
         except Exception:
             return False
 
 
+# =============================================================================
+# SHARED CLIENTS
+# =============================================================================
+
+_CLIENT_LOCK = threading.Lock()
+_SHARED_CLIENTS: dict[str, ollama.Client] = {}
+
+# Async clients hold connections bound to the event loop that opened them
+# (each asyncio.run() call gets a fresh loop), so they are never cached
+# process-wide: one is opened per batch (or per standalone call) and closed
+# when it finishes. The batch's (host, client) is visible to its tasks here.
+_SCOPED_ASYNC_CLIENT: contextvars.ContextVar[Optional[tuple[str, ollama.AsyncClient]]] = (
+    contextvars.ContextVar("_SCOPED_ASYNC_CLIENT", default=None)
+)
+
+
+def _get_shared_client(host: str) -> ollama.Client:
+    """Return the process-wide ollama.Client for `host`."""
+    with _CLIENT_LOCK:
+        client = _SHARED_CLIENTS.get(host)
+        if client is None:
+            client = ollama.Client(host=host, limits=OLLAMA_POOL_LIMITS)
+            _SHARED_CLIENTS[host] = client
+        return client
+
+
+@contextlib.asynccontextmanager
+async def _async_client(host: str) -> AsyncIterator[ollama.AsyncClient]:
+    """
+    Yield an ollama.AsyncClient for `host`.
+    
+    Inside `_async_client_scope` for the same host the scope's client is
+    reused; otherwise a client is opened for this call and closed after.
+    """
+    scoped = _SCOPED_ASYNC_CLIENT.get()
+    if scoped is not None and scoped[0] == host:
+        yield scoped[1]
+        return
+    
+    client = ollama.AsyncClient(host=host, limits=OLLAMA_POOL_LIMITS)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+@contextlib.asynccontextmanager
+async def _async_client_scope(host: str) -> AsyncIterator[None]:
+    """Share one ollama.AsyncClient for `host` across the calls in this block."""
+    async with _async_client(host) as client:
+        token = _SCOPED_ASYNC_CLIENT.set((host, client))
+        try:
+            yield
+        finally:
+            _SCOPED_ASYNC_CLIENT.reset(token)
+
+
+def _reported_count(usage, field: str) -> Optional[int]:
+    """Read a token count reported by Ollama, or None if it is absent."""
+    if usage is None:
+        return None
+    return usage.get(field) or None
+
+
+def _estimate_tokens(char_count: int) -> int:
+    """Estimate tokens for a text of `char_count` characters (~1 per 4)."""
+    return (char_count >> _TOKEN_SHIFT) or 1
+
+
+def _estimate_cost(char_count: int) -> tuple[int, float]:
+    """Estimate (tokens, cost) for a text of `char_count` characters."""
+    estimated_tokens = _estimate_tokens(char_count)
+    
+    # Calculate cost: $0.015 per 1k tokens
+    simulated_cost = estimated_tokens * _COST_UNITS_PER_TOKEN / _COST_UNITS_PER_DOLLAR
+    
+    return estimated_tokens, simulated_cost
+
+
+# Non-strict: models routinely put raw newlines inside multi-line answers
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+
+def _parse_answer_array(text: str, expected: int) -> list[str]:
+    """
+    Extract the JSON array of answers from a row-marshaled response.
+    
+    Models often wrap the array in prose or a code fence, so when the reply
+    is not bare JSON, every '[' is tried as the start of an array and the
+    first one that decodes to a list of `expected` answers wins.
+    """
+    try:
+        answers = _JSON_DECODER.decode(text)
+    except json.JSONDecodeError:
+        answers = _find_answer_array(text, expected)
+        if answers is None:
+            raise ValueError(f"Batched response did not contain a JSON array of {expected} answers")
+    
+    if not isinstance(answers, list) or len(answers) != expected:
+        found = len(answers) if isinstance(answers, list) else type(answers).__name__
+        raise ValueError(f"Expected {expected} batched answers, got {found}")
+    
+    return [str(answer) for answer in answers]
+
+
+def _find_answer_array(text: str, expected: int) -> Optional[list]:
+    """Return the first JSON list of `expected` items embedded in `text`."""
+    start = text.find("[")
+    while start >= 0:
+        try:
+            candidate, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(candidate, list) and len(candidate) == expected:
+                return candidate
+        start = text.find("[", start + 1)
+    return None
+
+
 # =============================================================================
 # CONVENIENCE FUNCTION
 # =============================================================================
 
+_DEFAULT_BRAIN_LOCK = threading.Lock()
+_DEFAULT_BRAIN: Optional[LLMBrain] = None
+
+
+def get_default_brain() -> LLMBrain:
+    """
+    Return the process-wide LLMBrain, creating it on first use.
+    
+    Shared by `ask_llama` and by agents built without an explicit brain,
+    so the Ollama client and response cache are set up once per process.
+    Its cost counters are process-wide too: callers that report their own
+    spend should snapshot them and subtract.
+    """
+    global _DEFAULT_BRAIN
+    brain = _DEFAULT_BRAIN
+    if brain is None:
+        with _DEFAULT_BRAIN_LOCK:
+            if _DEFAULT_BRAIN is None:
+                _DEFAULT_BRAIN = LLMBrain()
+            brain = _DEFAULT_BRAIN
+    return brain
+
+
 def ask_llama(prompt: str, system_message: Optional[str] = None) -> str:
     """
     Simple convenience function for quick LLM queries.
     
-    This is a stateless wrapper around LLMBrain for simple use cases.
-    For budget-tracked operations, use LLMBrain directly.
+    This is a thin wrapper around a shared, process-wide LLMBrain for
+    simple use cases. For budget-tracked operations, use LLMBrain directly.
+    
+    Answers are memoized per (prompt, system_message), so repeating a
+    question is served from memory at no cost. Cache statistics are
+    available via `ask_llama.cache_info()`; use `ask_llama.cache_clear()`
+    to force fresh answers.
     
     Args:
         prompt: The question or instruction for the LLM
@@ -277,11 +1092,20 @@ def ask_llama(prompt: str, system_message: Optional[str] = None) -> str:
         >>> response = ask_llama("What is S3?", "Be concise.")
         >>> print(response)
     """
-    brain = LLMBrain()
-    response = brain.generate_response(prompt, system_message)
+    return _ask_llama_cached(prompt, system_message or "")
+
+
+@functools.lru_cache(maxsize=256)
+def _ask_llama_cached(prompt: str, system_message: str) -> str:
+    """Memoized body of `ask_llama` (an empty system message means none)."""
+    response = get_default_brain().generate_response(prompt, system_message or None)
     return response.text
 
 
+ask_llama.cache_info = _ask_llama_cached.cache_info  # type: ignore[attr-defined]
+ask_llama.cache_clear = _ask_llama_cached.cache_clear  # type: ignore[attr-defined]
+
+
 # =============================================================================
 # CONNECTION TEST
 # =============================================================================
@@ -334,9 +1158,9 @@ if __name__ == "__main__":
     print("📊 FISCAL SUMMARY")
     print("-" * 60)
     summary = brain.get_fiscal_summary()
-    print(f"Total tokens used:    {summary['total_tokens_used']}")
-    print(f"Total cost incurred:  ${summary['total_cost_incurred']:.6f}")
-    print(f"Cost rate:            ${summary['cost_per_1k_tokens']}/1k tokens")
+    print(f"Total tokens used:    {summary.total_tokens_used}")
+    print(f"Total cost incurred:  ${summary.total_cost_incurred:.6f}")
+    print(f"Cost rate:            ${summary.cost_per_1k_tokens}/1k tokens")
     
     print("\n" + "=" * 60)
     print("🎉 All tests passed! LLM Brain is ready for the AI Squad.")
@@ -23,8 +23,7 @@ govern with circuit breakers.
 """
 
 from brain import ask_llama
-import boto3
-from botocore.config import Config
+from _clients import get_s3_client
 
 
 # =============================================================================
@@ -35,22 +34,9 @@ LOCALSTACK_ENDPOINT = "http://localhost:4566"
 BUCKET_NAME = "milestone-bucket"
 FILE_NAME = "hello_agent.txt"
 
-# Configure boto3 for LocalStack
+# Shared S3 client pointing to LocalStack
 # No real AWS credentials needed - LocalStack accepts any credentials
-localstack_config = Config(
-    signature_version='s3v4',
-    retries={'max_attempts': 3}
-)
-
-# Initialize S3 client pointing to LocalStack
-s3_client = boto3.client(
-    's3',
-    endpoint_url=LOCALSTACK_ENDPOINT,
-    aws_access_key_id='test',           # LocalStack default
-    aws_secret_access_key='test',       # LocalStack default
-    region_name='us-east-1',
-    config=localstack_config
-)
+s3_client = get_s3_client(LOCALSTACK_ENDPOINT)
 
 
 # =============================================================================
@@ -22,8 +22,9 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import math
-from typing import Optional
-from brain import LLMBrain, LLMResponse, CHARS_PER_TOKEN, COST_PER_1K_TOKENS
+from concurrent.futures import Future
+from typing import AsyncIterator, Iterator, Optional, Sequence
+from brain import FiscalSummary, LLMBrain, LLMResponse, CHARS_PER_TOKEN, COST_PER_1K_TOKENS
 from accountant_agent import AccountantAgent, BudgetExceededException
 
 
@@ -57,11 +58,11 @@ class BudgetGuardInterceptor:
         For now, we heuristically guess that the output will be roughly
         2x the length of the input, and calculate cost using LLMBrain constants.
         """
-        input_text = (system_message or "") + prompt
+        input_chars = len(system_message or "") + len(prompt)
         
         # Heuristic: Output is often larger than the input prompt for these tasks.
         # Let's assume output is 2x the input size to be conservative.
-        estimated_total_chars = len(input_text) * 3 
+        estimated_total_chars = input_chars * 3
         
         estimated_tokens = max(1, estimated_total_chars // CHARS_PER_TOKEN)
         estimated_cost = (estimated_tokens / 1000) * COST_PER_1K_TOKENS
@@ -82,6 +83,108 @@ class BudgetGuardInterceptor:
         Raises:
             BudgetExceededException: If the Accountant denies the funds.
         """
+        self._authorize(prompt, system_message)
+        return self._brain.generate_response(prompt, system_message)
+    
+    def submit_response(self, prompt: str, system_message: Optional[str] = None) -> "Future[LLMResponse]":
+        """
+        Intercept a background generation request.
+        
+        Funds are cleared before the request is queued, so a denial is
+        raised to the caller rather than stored on the Future.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        self._authorize(prompt, system_message)
+        return self._brain.submit_response(prompt, system_message)
+    
+    async def agenerate_response(self, prompt: str, system_message: Optional[str] = None) -> LLMResponse:
+        """
+        Intercept an asynchronous generation request.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        self._authorize(prompt, system_message)
+        return await self._brain.agenerate_response(prompt, system_message)
+    
+    async def agenerate_batch(
+        self, 
+        prompts: Sequence[tuple[str, Optional[str]]],
+        max_concurrent: Optional[int] = None
+    ) -> list[LLMResponse]:
+        """
+        Intercept a concurrent batch of generation requests.
+        
+        Every request in the batch is cleared with the Accountant before any
+        of them is dispatched, so a denial halts the whole batch up front.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        for prompt, system_message in prompts:
+            self._authorize(prompt, system_message)
+        return await self._brain.agenerate_batch(prompts, max_concurrent)
+    
+    async def agenerate_many(
+        self, 
+        prompts: Sequence[str], 
+        system_message: Optional[str] = None,
+        max_concurrent: Optional[int] = None
+    ) -> list[LLMResponse]:
+        """
+        Intercept a concurrent batch sharing one system message.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        return await self.agenerate_batch(
+            [(prompt, system_message) for prompt in prompts],
+            max_concurrent
+        )
+    
+    def generate_response_stream(self, prompt: str, system_message: Optional[str] = None) -> Iterator[str]:
+        """
+        Intercept a streaming generation request.
+        
+        Funds are requested when this method is called, not when the
+        returned iterator is first advanced.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        self._authorize(prompt, system_message)
+        return self._brain.generate_response_stream(prompt, system_message)
+    
+    def agenerate_response_stream(self, prompt: str, system_message: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Intercept an asynchronous streaming generation request.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        self._authorize(prompt, system_message)
+        return self._brain.agenerate_response_stream(prompt, system_message)
+    
+    def generate_batched(
+        self, 
+        prompts: list[str], 
+        system_message: Optional[str] = None,
+        batch_size: int = 8
+    ) -> list[LLMResponse]:
+        """
+        Intercept a row-marshaled batch of generation requests.
+        
+        Raises:
+            BudgetExceededException: If the Accountant denies the funds.
+        """
+        for prompt in prompts:
+            self._authorize(prompt, system_message)
+        return self._brain.generate_batched(prompts, system_message, batch_size)
+    
+    def _authorize(self, prompt: str, system_message: Optional[str]) -> None:
+        """Predict the CtC of a request and obtain clearance from the Accountant."""
         print(f"[{self.agent_name.upper()} GUARD] Intercepting request...")
         
         # 1. Predict the cost (Mock CtC)
@@ -91,18 +194,34 @@ class BudgetGuardInterceptor:
         # 2. Request funds from Accountant (will raise exception if denied)
         self._accountant.request_funds(self.agent_name, estimated_cost)
         
-        # 3. If approved, delegate to the actual brain
+        # 3. If approved, the caller delegates to the actual brain
         print(f"[{self.agent_name.upper()} GUARD] Funds approved. Executing task...")
-        return self._brain.generate_response(prompt, system_message)
         
     def calculate_simulated_cost(self, text: str) -> tuple[int, float]:
         """Pass-through to underlying brain."""
         return self._brain.calculate_simulated_cost(text)
         
-    def get_fiscal_summary(self) -> dict:
+    def calculate_simulated_cost_batch(self, texts: list[str]) -> tuple[list[int], list[float]]:
+        """Pass-through to underlying brain."""
+        return self._brain.calculate_simulated_cost_batch(texts)
+        
+    def get_fiscal_summary(self) -> FiscalSummary:
         """Pass-through to underlying brain."""
         return self._brain.get_fiscal_summary()
 
+    def ensure_session(self) -> bool:
+        """Pass-through to underlying brain (warm-up is not billed)."""
+        return self._brain.ensure_session()
+
+    def get_latency_stats(self) -> dict:
+        """Pass-through to underlying brain."""
+        return self._brain.get_latency_stats()
+
+    @property
+    def model(self) -> str:
+        """Property pass-through for the underlying model identifier."""
+        return self._brain.model
+
     @property
     def total_cost_incurred(self) -> float:
         """Property pass-through for Researcher/Writer specific logging."""
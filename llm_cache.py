@@ -0,0 +1,191 @@
+"""
+llm_cache.py - Response Cache for Agent LLM Calls
+
+=============================================================================
+LLM CACHE: NEVER PAY TWICE FOR THE SAME ANSWER
+=============================================================================
+
+The LLM call is the dominant cost and latency of every agent workflow.
+When an agent is re-run on identical input - a retried pipeline, a replay
+during testing - the answer it needs has already been paid for.
+
+`LLMCache` stores LLM responses under a content hash of the request, so a
+cache hit skips the LLM Brain (and the Budget Guard's fund request) entirely.
+Storage is pluggable:
+
+    MemoryCacheBackend   Bounded in-process LRU (default)
+    FileCacheBackend     One JSON file per entry; survives restarts and
+                         can be shared by several processes
+
+=============================================================================
+"""
+
+import os
+import sys
+
+# Add project root to path to resolve local module imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import hashlib
+import json
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Optional, Protocol
+from brain import LLMResponse
+
+
+# Default number of responses kept by the in-memory backend
+DEFAULT_MAX_ENTRIES = 256
+
+
+class CacheBackend(Protocol):
+    """Storage interface for `LLMCache`: string keys to JSON-able dicts."""
+
+    def get(self, key: str) -> Optional[dict]:
+        ...
+
+    def set(self, key: str, value: dict) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    Bounded in-memory LRU backend.
+
+    Attributes:
+        max_entries (int): Entries kept before the least recently used
+            one is evicted
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class FileCacheBackend:
+    """
+    Persistent backend storing one JSON file per entry.
+
+    Writes go to a temporary file that is atomically renamed into place,
+    so concurrent readers never observe a partially written entry.
+
+    Attributes:
+        directory (str): Folder holding the cache files
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class LLMCache:
+    """
+    Content-addressed cache of `LLMResponse` objects.
+
+    Example:
+        >>> cache = LLMCache()
+        >>> key = LLMCache.make_key(system_prompt, raw_notes)
+        >>> response = cache.get(key)
+        >>> if response is None:
+        ...     response = brain.generate_response(prompt, system_prompt)
+        ...     cache.set(key, response)
+
+    Attributes:
+        backend: The storage backend (default: MemoryCacheBackend)
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that found nothing
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (default: a new MemoryCacheBackend)
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the request content.
+
+        Args:
+            parts: Everything that determines the response (e.g. the
+                system prompt and the user input)
+
+        Returns:
+            str: Hex SHA-256 digest of the newline-joined parts
+        """
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Replayed responses report all of their tokens as `cached_tokens`
+        and a `simulated_cost` of zero, since nothing is spent on them.
+
+        Args:
+            key: Key from `make_key`
+
+        Returns:
+            LLMResponse or None: The cached response, if present
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        response = LLMResponse(**value)
+        return replace(response, simulated_cost=0.0, cached_tokens=response.estimated_tokens)
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from `make_key`
+            response: The response to remember
+        """
+        self.backend.set(key, asdict(response))
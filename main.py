@@ -28,19 +28,11 @@ from budget_guard import BudgetGuardInterceptor
 from brain import LLMBrain
 from researcher import ResearcherAgent, BUCKET_NAME, INPUT_FILE, LOCALSTACK_ENDPOINT
 from writer import WriterAgent
-import boto3
-from botocore.config import Config
+from _clients import get_s3_client
 
 def setup_test_environment():
     """Seed the LocalStack bucket with a test research topic."""
-    s3_client = boto3.client(
-        's3',
-        endpoint_url=LOCALSTACK_ENDPOINT,
-        aws_access_key_id='test',
-        aws_secret_access_key='test',
-        region_name='us-east-1',
-        config=Config(signature_version='s3v4')
-    )
+    s3_client = get_s3_client(LOCALSTACK_ENDPOINT)
     
     # Ensure bucket exists
     try:
@@ -86,6 +78,7 @@ def run_mesh(daily_limit: float):
         
         print("\n--- PHASE 3.2: WRITING ---")
         writer.polish_and_publish()
+        writer.wait_for_writes()
         
         print("\n>>> PIPELINE SUCCESSFUL: Tasks completed within budget.")
         
@@ -0,0 +1,104 @@
+"""
+parallel_runner.py - Concurrent Execution Helper for the Agent Mesh
+
+=============================================================================
+PARALLEL AGENT RUNNER: OVERLAPPING INDEPENDENT AGENT WORK
+=============================================================================
+
+Agent methods block on network I/O - S3 round-trips and LLM calls. Ollama
+computes responses largely one at a time, but the HTTP time around each
+call can overlap, so running independent agent tasks side by side cuts
+wall-clock time even against a single local model.
+
+The runner executes a list of (agent, method, args) tasks on a thread pool
+and hands each result back the moment it completes, so the caller can feed
+finished work into the next stage without waiting for the slowest task.
+
+Only hand it tasks that are independent of one another: the Writer reads
+what the Researcher wrote, so those two stages still run in sequence.
+
+=============================================================================
+"""
+
+import os
+import sys
+
+# Add project root to path to resolve local module imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+from brain import OLLAMA_NUM_PARALLEL
+
+
+# (agent, method name, positional args)
+AgentTask = tuple[Any, str, tuple]
+
+
+class ParallelAgentRunner:
+    """
+    Runs independent agent tasks concurrently on a bounded thread pool.
+
+    Example:
+        >>> runner = ParallelAgentRunner()
+        >>> notes = runner.run([
+        ...     (researcher, "research_and_summarize", (BUCKET_NAME, "topic_a.txt", "notes_a.txt")),
+        ...     (researcher, "research_and_summarize", (BUCKET_NAME, "topic_b.txt", "notes_b.txt")),
+        ... ])
+
+    Attributes:
+        max_workers (int): Maximum number of tasks in flight at once
+    """
+
+    def __init__(self, max_workers: int = OLLAMA_NUM_PARALLEL):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Maximum concurrent tasks (default: OLLAMA_NUM_PARALLEL)
+        """
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        tasks: list[AgentTask],
+        on_complete: Optional[Callable[[int, Any], None]] = None
+    ) -> list[Any]:
+        """
+        Execute every task and collect the results.
+
+        Args:
+            tasks: List of (agent, method_name, args) tuples
+            on_complete: Optional callback invoked as (task_index, result)
+                as soon as each task finishes, in completion order
+
+        Returns:
+            list: Task results in the same order as `tasks`
+
+        Raises:
+            Exception: The first task failure observed. Tasks already
+                running are allowed to finish; queued tasks are cancelled.
+        """
+        results: list[Any] = [None] * len(tasks)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(getattr(agent, method), *args): index
+                for index, (agent, method, args) in enumerate(tasks)
+            }
+
+            pending = set(futures)
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = futures[future]
+                        results[index] = future.result()
+                        if on_complete is not None:
+                            on_complete(index, results[index])
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return results
@@ -23,16 +23,17 @@ Responsibilities:
 =============================================================================
 """
 
+import asyncio
 import os
 import sys
 
 # Add project root to path to resolve local module imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
-from botocore.config import Config
-from brain import LLMBrain, LLMResponse
+from _clients import get_s3_client
+from brain import FiscalSummary, LLMBrain, LLMResponse
 
 
 # =============================================================================
@@ -44,6 +45,9 @@ BUCKET_NAME = "milestone-bucket"
 INPUT_FILE = "research_topic.txt"
 OUTPUT_FILE = "research_notes.txt"
 
+# Concurrent S3 uploads per agent for bulk writes
+S3_UPLOAD_WORKERS = 8
+
 
 # =============================================================================
 # RESEARCHER AGENT
@@ -64,7 +68,7 @@ class ResearcherAgent:
     
     Attributes:
         brain (LLMBrain): The central LLM interface
-        s3_client: Boto3 S3 client configured for LocalStack
+        s3_client: Shared Boto3 S3 client configured for LocalStack
         system_prompt (str): The agent's persona definition
     
     Example:
@@ -91,15 +95,11 @@ class ResearcherAgent:
         # Initialize the LLM Brain for intelligent analysis
         self.brain = brain if brain is not None else LLMBrain()
         
-        # Configure S3 client for LocalStack
-        self.s3_client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name='us-east-1',
-            config=Config(signature_version='s3v4')
-        )
+        # Shared S3 client for LocalStack
+        self.s3_client = get_s3_client(endpoint_url)
+        
+        # Worker pool for bulk uploads (threads start on first use)
+        self._s3_pool = ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS)
         
         self.system_prompt = self.SYSTEM_PROMPT
     
@@ -149,6 +149,40 @@ class ResearcherAgent:
         except Exception as e:
             raise Exception(f"Failed to write to S3: {e}")
     
+    def write_many_to_s3(self, bucket: str, items: list[tuple[str, str]]) -> bool:
+        """
+        Write several text files to an S3 bucket concurrently.
+        
+        Each upload runs on the agent's worker pool over the shared
+        (thread-safe) S3 client, so N files cost roughly one round-trip of
+        wall-clock time instead of N.
+        
+        Args:
+            bucket: The S3 bucket name
+            items: List of (key, content) pairs to write
+            
+        Returns:
+            bool: True if every file was written
+            
+        Raises:
+            Exception: If any upload fails (all uploads are attempted first)
+        """
+        futures = {
+            self._s3_pool.submit(self.write_to_s3, bucket, key, content): key
+            for key, content in items
+        }
+        
+        failed = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed.append(f"{futures[future]} ({e})")
+        
+        if failed:
+            raise Exception(f"Failed to write {len(failed)} of {len(items)} files to S3: {'; '.join(failed)}")
+        return True
+    
     def analyze_topic(self, topic: str) -> LLMResponse:
         """
         Analyze a research topic and generate a 3-point summary.
@@ -162,7 +196,31 @@ class ResearcherAgent:
         Returns:
             LLMResponse: Structured response with summary and cost metadata
         """
-        prompt = f"""Analyze the following research topic and provide a 3-point technical summary.
+        return self.brain.generate_response(
+            prompt=self._build_prompt(topic),
+            system_message=self.system_prompt
+        )
+    
+    def analyze_topics(self, topics: list[str]) -> list[LLMResponse]:
+        """
+        Analyze several research topics concurrently.
+        
+        All topics are sent to the LLM Brain at once via `agenerate_batch`,
+        so the batch completes in roughly the time of the slowest analysis
+        rather than the sum of all of them.
+        
+        Args:
+            topics: The raw research topic texts
+            
+        Returns:
+            list[LLMResponse]: One response per topic, in input order
+        """
+        requests = [(self._build_prompt(topic), self.system_prompt) for topic in topics]
+        return asyncio.run(self.brain.agenerate_batch(requests))
+    
+    def _build_prompt(self, topic: str) -> str:
+        """Build the 3-point analysis prompt for a topic."""
+        return f"""Analyze the following research topic and provide a 3-point technical summary.
 
 RESEARCH TOPIC:
 {topic}
@@ -173,11 +231,6 @@ Provide your analysis as:
 3. [Third key insight]
 
 Be concise and focus on cloud governance implications."""
-
-        return self.brain.generate_response(
-            prompt=prompt,
-            system_message=self.system_prompt
-        )
     
     def research_and_summarize(
         self, 
@@ -245,12 +298,12 @@ ANALYSIS:
         """
         return self.brain.total_cost_incurred
     
-    def get_fiscal_summary(self) -> dict:
+    def get_fiscal_summary(self) -> FiscalSummary:
         """
         Get the fiscal summary from the LLM Brain.
         
         Returns:
-            dict: Fiscal metrics including tokens and costs
+            FiscalSummary: Fiscal metrics including tokens and costs
         """
         return self.brain.get_fiscal_summary()
 
@@ -288,8 +341,8 @@ if __name__ == "__main__":
         
         # Fiscal summary
         fiscal = researcher.get_fiscal_summary()
-        print(f"\nSession Cost: ${fiscal['total_cost_incurred']:.6f}")
-        print(f"Total Tokens: {fiscal['total_tokens_used']}")
+        print(f"\nSession Cost: ${fiscal.total_cost_incurred:.6f}")
+        print(f"Total Tokens: {fiscal.total_tokens_used}")
         
     except FileNotFoundError as e:
         print(f"\n[ERROR] {e}")
@@ -22,19 +22,37 @@ Responsibilities:
 Workflow Position:
     Researcher Agent → [research_notes.txt] → Writer Agent → [executive_summary.txt]
 
+Storage Format:
+    Reports larger than GZIP_MIN_BYTES (4 KB - most executive summaries)
+    are stored gzip-compressed with `ContentEncoding: gzip`. `read_from_s3`
+    decompresses them transparently, but other readers (e.g. `aws s3 cp`)
+    receive the compressed bytes and must gunzip them.
+
 =============================================================================
 """
 
+import codecs
+import functools
+import gzip
+import hashlib
+import io
 import os
 import sys
+import threading
 
 # Add project root to path to resolve local module imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-import boto3
-from typing import Optional
-from botocore.config import Config
-from brain import LLMBrain, LLMResponse
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from typing import Optional, Union
+from botocore.exceptions import ClientError
+from _clients import S3_MULTIPART_THRESHOLD, S3_TRANSFER_CONFIG, get_s3_client
+from brain import (
+    CHARS_PER_TOKEN, BatchParseError, FiscalSummary, LLMBrain, LLMResponse, get_default_brain
+)
+from llm_cache import LLMCache
 
 
 # =============================================================================
@@ -46,6 +64,230 @@ BUCKET_NAME = "milestone-bucket"
 INPUT_FILE = "research_notes.txt"
 OUTPUT_FILE = "reports/executive_summary.txt"
 
+# Bytes pulled from the S3 response stream per read
+S3_READ_CHUNK_SIZE = 64 * 1024
+
+# Uploads larger than this are gzip-compressed (ContentEncoding: gzip);
+# below it the gzip header and round-trip outweigh the savings
+GZIP_MIN_BYTES = 4096
+GZIP_LEVEL = 6
+
+# Concurrent S3 transfers per Writer (batch reads and background uploads)
+S3_IO_WORKERS = 8
+
+
+# =============================================================================
+# PROMPT TEMPLATE
+# =============================================================================
+
+# The notes are spliced between these with str.join, which sizes the
+# result once and copies the (possibly large) notes exactly once
+PROMPT_PREFIX = """Format this into a professional executive summary.
+
+RAW RESEARCH NOTES:
+"""
+
+PROMPT_SUFFIX = """
+
+Create an executive summary with:
+- A clear title
+- An executive overview paragraph
+- Key findings with professional headings
+- A brief conclusion with recommendations
+
+Use professional business language suitable for C-level executives."""
+
+# Notes shorter than this (ignoring surrounding whitespace) are not worth a
+# paid LLM call; they get a canned summary instead
+MIN_NOTE_CHARS = 40
+EMPTY_NOTES_SUMMARY = "(No substantive notes to summarize.)"
+
+# Token budget for the notes; anything past it would be billed but fall
+# outside the model's context window
+MAX_INPUT_TOKENS = 8192
+MAX_NOTE_CHARS = CHARS_PER_TOKEN * MAX_INPUT_TOKENS
+
+# Batched summaries share one call only while their notes together stay
+# within the same input budget as a single call
+MAX_BATCH_NOTE_CHARS = MAX_NOTE_CHARS
+
+
+# Layout of the notes written by ResearcherAgent.research_and_summarize: a
+# header, metadata lines, then the topic and analysis sections
+RESEARCH_NOTES_HEADER = "RESEARCH NOTES\n==============\n"
+TOPIC_SECTION = "\nORIGINAL TOPIC:\n"
+ANALYSIS_SECTION = "\nANALYSIS:\n"
+
+
+# =============================================================================
+# TOKEN COUNTING
+# =============================================================================
+
+# tiktoken has no encodings for local models; this one is the closest match
+# to the Llama 3 tokenizer
+FALLBACK_ENCODING = "cl100k_base"
+
+# Token counts remembered per (model, content hash)
+TOKEN_COUNT_CACHE_SIZE = 1024
+
+_token_counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_token_counts_lock = threading.Lock()
+
+
+# =============================================================================
+# REPORT LAYOUT
+# =============================================================================
+
+REPORT_SEPARATOR = "=" * 70
+
+REPORT_HEADER = "\n".join((
+    REPORT_SEPARATOR,
+    "EXECUTIVE SUMMARY",
+    "Generated by: Writer Agent | Budget-Aware AI Squad",
+    REPORT_SEPARATOR,
+    "",
+    "",
+))
+
+
+def _has_substance(notes: str) -> bool:
+    """
+    Return True if the notes are long enough to be worth summarizing.
+    
+    Pass compacted notes (see `_compact_notes`): the Researcher header and
+    metadata alone would otherwise clear MIN_NOTE_CHARS.
+    """
+    return len(notes.strip()) >= MIN_NOTE_CHARS
+
+
+def _compact_notes(raw_notes: str) -> str:
+    """
+    Reduce Researcher-Agent notes to the sections worth summarizing.
+    
+    The header and metadata lines (source, tokens, cost) carry nothing for
+    an executive summary, so only the topic and analysis are kept. Notes
+    in any other layout are returned unchanged.
+    """
+    if not raw_notes.startswith(RESEARCH_NOTES_HEADER):
+        return raw_notes
+    topic_at = raw_notes.find(TOPIC_SECTION, len(RESEARCH_NOTES_HEADER))
+    analysis_at = raw_notes.find(ANALYSIS_SECTION, topic_at + 1)
+    if topic_at < 0 or analysis_at < 0:
+        return raw_notes
+    
+    topic = raw_notes[topic_at + len(TOPIC_SECTION):analysis_at].strip()
+    analysis = raw_notes[analysis_at + len(ANALYSIS_SECTION):].strip()
+    return f"TOPIC: {topic}\n\nANALYSIS:\n{analysis}"
+
+
+def _truncate_notes(raw_notes: str) -> str:
+    """
+    Cut notes down to MAX_NOTE_CHARS, ending on a line boundary.
+    
+    Notes within the budget are returned unchanged. A single overlong
+    line is cut hard at the limit.
+    """
+    if len(raw_notes) <= MAX_NOTE_CHARS:
+        return raw_notes
+    cut = raw_notes.rfind('\n', 0, MAX_NOTE_CHARS)
+    return raw_notes[:cut if cut > 0 else MAX_NOTE_CHARS]
+
+
+@functools.lru_cache(maxsize=4)
+def _get_tokenizer(model: str):
+    """
+    Load the tiktoken encoding for a model once per process.
+    
+    tiktoken is optional: returns None when it is not installed or its
+    encoding cannot be loaded (tiktoken downloads the BPE file on first use,
+    which fails offline), and callers fall back to the brain's estimate.
+    The outcome is cached either way, so a failed load is not retried.
+    """
+    try:
+        import tiktoken  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception:
+        return None
+
+
+def _build_report(
+    bucket: str, 
+    input_key: str, 
+    output_key: str, 
+    response: LLMResponse
+) -> bytearray:
+    """
+    Lay out an executive summary as a UTF-8 report ready for upload.
+    
+    Each part is encoded straight into the upload buffer instead of
+    building the full report as a str first.
+    """
+    footer = "\n".join((
+        "",
+        "",
+        REPORT_SEPARATOR,
+        "DOCUMENT METADATA",
+        REPORT_SEPARATOR,
+        f"Source: s3://{bucket}/{input_key}",
+        f"Output: s3://{bucket}/{output_key}",
+        f"Tokens Used: {response.estimated_tokens} ({response.cached_tokens} replayed from cache)",
+        f"Generation Cost: ${response.simulated_cost:.6f}",
+        "Cost Rate: $0.015 per 1,000 tokens",
+        REPORT_SEPARATOR,
+        "",
+    ))
+    encoder = codecs.getincrementalencoder('utf-8')()
+    report_content = bytearray()
+    report_content += encoder.encode(REPORT_HEADER)
+    report_content += encoder.encode(response.text)
+    report_content += encoder.encode(footer, final=True)
+    return report_content
+
+
+def _group_by_size(pending: list[tuple[int, str, str]]) -> list[list[tuple[int, str, str]]]:
+    """Split (index, key, notes) items into groups within MAX_BATCH_NOTE_CHARS."""
+    groups: list[list[tuple[int, str, str]]] = []
+    group_chars = 0
+    for item in pending:
+        notes_chars = len(item[2])
+        if not groups or group_chars + notes_chars > MAX_BATCH_NOTE_CHARS:
+            groups.append([])
+            group_chars = 0
+        groups[-1].append(item)
+        group_chars += notes_chars
+    return groups
+
+
+def _add_wasted_share(
+    response: LLMResponse, 
+    wasted: LLMResponse, 
+    position: int, 
+    count: int
+) -> LLMResponse:
+    """Charge one of `count` equal shares of a failed batched call to a response."""
+    tokens = wasted.estimated_tokens // count
+    if position == count - 1:
+        tokens += wasted.estimated_tokens % count
+    return replace(
+        response,
+        estimated_tokens=response.estimated_tokens + tokens,
+        simulated_cost=response.simulated_cost + wasted.simulated_cost / count
+    )
+
+
+def _flush_log(lines: list[str]) -> None:
+    """Write buffered status lines to stdout in one call and clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
 
 # =============================================================================
 # WRITER AGENT
@@ -70,7 +312,7 @@ class WriterAgent:
     
     Attributes:
         brain (LLMBrain): The central LLM interface
-        s3_client: Boto3 S3 client configured for LocalStack
+        s3_client: Shared Boto3 S3 client configured for LocalStack
         system_prompt (str): The agent's persona definition
     
     Example:
@@ -87,26 +329,40 @@ class WriterAgent:
         "structure the content for C-level readability."
     )
     
-    def __init__(self, endpoint_url: str = LOCALSTACK_ENDPOINT, brain: Optional[LLMBrain] = None):
+    def __init__(
+        self, 
+        endpoint_url: str = LOCALSTACK_ENDPOINT, 
+        brain: Optional[LLMBrain] = None,
+        cache: Optional[LLMCache] = None
+    ):
         """
         Initialize the Writer Agent.
         
         Args:
             endpoint_url: The LocalStack endpoint (default: http://localhost:4566)
-            brain: The LLMBrain or BudgetGuard interceptor instance.
+            brain: The LLMBrain or BudgetGuard interceptor instance
+                (default: the process-wide shared LLMBrain)
+            cache: Response cache for executive summaries (default: in-memory)
         """
-        # Initialize the LLM Brain for content transformation
-        self.brain = brain if brain is not None else LLMBrain()
-        
-        # Configure S3 client for LocalStack
-        self.s3_client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name='us-east-1',
-            config=Config(signature_version='s3v4')
-        )
+        # Share the process-wide LLM Brain rather than building one per Writer
+        self.brain = brain if brain is not None else get_default_brain()
+        
+        # The brain may be shared, so this Writer's spend is measured from here
+        self._cost_at_start = self.brain.total_cost_incurred
+        
+        # Summaries of notes we have already polished are never paid for twice
+        self._cache = cache if cache is not None else LLMCache()
+        
+        # Shared S3 client for LocalStack
+        self.s3_client = get_s3_client(endpoint_url)
+        
+        # Resolved once here rather than on every read
+        self._NoSuchKey = self.s3_client.exceptions.NoSuchKey
+        
+        # Background I/O: overlaps the notes download with LLM warm-up and
+        # lets report uploads finish after the summary is returned
+        self._io_pool = ThreadPoolExecutor(max_workers=S3_IO_WORKERS, thread_name_prefix="writer-io")
+        self._pending_writes: list[Future] = []
         
         self.system_prompt = self.SYSTEM_PROMPT
     
@@ -125,36 +381,116 @@ class WriterAgent:
             FileNotFoundError: If file doesn't exist
             Exception: If read fails for other reasons
         """
+        return self._read_with_meta(bucket, key)[0]
+    
+    def _read_with_meta(self, bucket: str, key: str) -> tuple[str, int, str]:
+        """
+        Read a text file from S3, also returning its size in bytes and ETag.
+        
+        The byte count is tallied from the chunks as they stream in, so
+        callers can size the LLM prompt without measuring the text again.
+        Objects stored with `ContentEncoding: gzip` are decompressed on the
+        fly, and the count is of the decompressed bytes. The ETag is the one
+        returned with the body, so it always identifies the version read.
+        
+        Returns:
+            tuple: (file contents, size in bytes, ETag)
+        """
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            return content
-        except self.s3_client.exceptions.NoSuchKey:
+            
+            # Decode the body as it streams in rather than buffering the
+            # whole object as bytes and then copying it into a str
+            body = response['Body']
+            if response.get('ContentEncoding') == 'gzip':
+                body = gzip.GzipFile(fileobj=body, mode='rb')
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            parts = []
+            byte_len = 0
+            while True:
+                chunk = body.read(S3_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                byte_len += len(chunk)
+                parts.append(decoder.decode(chunk))
+            parts.append(decoder.decode(b'', final=True))
+            return ''.join(parts), byte_len, response['ETag']
+        except self._NoSuchKey:
             raise FileNotFoundError(f"File '{key}' not found in bucket '{bucket}'")
         except Exception as e:
             raise Exception(f"Failed to read from S3: {e}")
     
-    def write_to_s3(self, bucket: str, key: str, content: str) -> bool:
+    def _notes_etag(self, bucket: str, key: str) -> str:
+        """
+        Fetch the ETag of an S3 object without downloading its body.
+        
+        Args:
+            bucket: The S3 bucket name
+            key: The file key/path
+            
+        Returns:
+            str: The object's ETag
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            Exception: If the lookup fails for other reasons
+        """
+        try:
+            return self.s3_client.head_object(Bucket=bucket, Key=key)['ETag']
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                raise FileNotFoundError(f"File '{key}' not found in bucket '{bucket}'")
+            raise Exception(f"Failed to read from S3: {e}")
+    
+    def _etag_cache_key(self, etag: str) -> str:
+        """Cache key for the summary of the notes version with this ETag."""
+        return LLMCache.make_key(self.system_prompt, f"s3-etag:{etag}")
+    
+    def write_to_s3(
+        self, 
+        bucket: str, 
+        key: str, 
+        content: Union[str, bytes, bytearray]
+    ) -> bool:
         """
         Write text content to S3 bucket.
         
         Note: S3 automatically handles "folder" creation when keys contain '/'.
+        Content larger than GZIP_MIN_BYTES is gzip-compressed first, and
+        `read_from_s3` transparently decompresses it again. Anything still
+        larger than S3_MULTIPART_THRESHOLD is sent as a multipart upload,
+        with the parts uploaded in parallel.
         
         Args:
             bucket: The S3 bucket name
             key: The file key/path (e.g., 'reports/executive_summary.txt')
-            content: The text content to write
+            content: The text to write - either a str, or UTF-8 bytes or
+                bytearray content that is uploaded as-is without another copy
             
         Returns:
             bool: True if successful
         """
+        body = content.encode('utf-8') if isinstance(content, str) else content
+        extra_args = {'ContentType': 'text/plain; charset=utf-8'}
+        if len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            extra_args['ContentEncoding'] = 'gzip'
         try:
-            self.s3_client.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=content.encode('utf-8'),
-                ContentType='text/plain'
-            )
+            if len(body) > S3_MULTIPART_THRESHOLD:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body),
+                    bucket,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=S3_TRANSFER_CONFIG
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=body,
+                    **extra_args
+                )
             return True
         except Exception as e:
             raise Exception(f"Failed to write to S3: {e}")
@@ -164,7 +500,13 @@ class WriterAgent:
         Transform raw research notes into a polished executive summary.
         
         This method sends the raw notes to the LLM Brain with the Writer's
-        persona, requesting professional formatting and structure.
+        persona, requesting professional formatting and structure. Notes
+        that have been summarized before are answered from the response
+        cache without calling the LLM Brain (or requesting funds), and
+        notes shorter than MIN_NOTE_CHARS get a canned, zero-cost reply.
+        Notes written by the Researcher Agent are stripped of their header
+        and metadata, and notes longer than MAX_NOTE_CHARS are truncated at
+        the last line break that fits before they are sent.
         
         Args:
             raw_notes: The raw research notes text
@@ -172,23 +514,133 @@ class WriterAgent:
         Returns:
             LLMResponse: Structured response with summary and cost metadata
         """
-        prompt = f"""Format this into a professional executive summary.
-
-RAW RESEARCH NOTES:
-{raw_notes}
-
-Create an executive summary with:
-- A clear title
-- An executive overview paragraph
-- Key findings with professional headings
-- A brief conclusion with recommendations
-
-Use professional business language suitable for C-level executives."""
-
-        return self.brain.generate_response(
+        raw_notes = _compact_notes(raw_notes)
+        if not _has_substance(raw_notes):
+            return LLMResponse(
+                text=EMPTY_NOTES_SUMMARY,
+                estimated_tokens=0,
+                simulated_cost=0.0,
+                model=self.brain.model
+            )
+        
+        raw_notes = _truncate_notes(raw_notes)
+        key = LLMCache.make_key(self.system_prompt, raw_notes)
+        response = self._cache.get(key)
+        if response is not None:
+            return response
+        
+        prompt = ''.join((PROMPT_PREFIX, raw_notes, PROMPT_SUFFIX))
+        response = self.brain.generate_response(
             prompt=prompt,
             system_message=self.system_prompt
         )
+        self._cache.set(key, response)
+        return response
+    
+    def format_executive_summaries(self, raw_notes_list: list[str]) -> list[LLMResponse]:
+        """
+        Transform several sets of research notes in as few LLM calls as possible.
+        
+        Behaves like `format_executive_summary` applied to each item, but
+        items not answered by the fast path or the cache are grouped so that
+        each group's notes fit within MAX_BATCH_NOTE_CHARS, and each group
+        is sent through the brain's row-marshaled `generate_batched`. The
+        system prompt and HTTP round-trip are shared within a group.
+        
+        A group of one, or a group whose batched reply cannot be split into
+        one answer per item, is summarized item by item instead. The failed
+        batched call has already been billed, so its tokens and cost are
+        spread over the retried items' responses to keep the totals honest.
+        Behind a Budget Guard, those items are also cleared with the
+        Accountant twice - once for the batched call and once for the retry.
+        
+        Args:
+            raw_notes_list: The raw research notes texts
+            
+        Returns:
+            list[LLMResponse]: One response per item, in input order
+        """
+        responses: dict[int, LLMResponse] = {}
+        pending: list[tuple[int, str, str]] = []  # (index, cache key, notes)
+        
+        for index, raw_notes in enumerate(raw_notes_list):
+            raw_notes = _compact_notes(raw_notes)
+            if not _has_substance(raw_notes):
+                responses[index] = LLMResponse(
+                    text=EMPTY_NOTES_SUMMARY,
+                    estimated_tokens=0,
+                    simulated_cost=0.0,
+                    model=self.brain.model
+                )
+                continue
+            
+            raw_notes = _truncate_notes(raw_notes)
+            key = LLMCache.make_key(self.system_prompt, raw_notes)
+            cached = self._cache.get(key)
+            if cached is None:
+                pending.append((index, key, raw_notes))
+            else:
+                responses[index] = cached
+        
+        for group in _group_by_size(pending):
+            wasted: Optional[LLMResponse] = None
+            if len(group) > 1:
+                prompts = [''.join((PROMPT_PREFIX, notes, PROMPT_SUFFIX)) for _, _, notes in group]
+                try:
+                    fresh = self.brain.generate_batched(
+                        prompts,
+                        system_message=self.system_prompt,
+                        batch_size=len(group)
+                    )
+                except BatchParseError as e:
+                    wasted = e.response
+                else:
+                    for (index, key, _), response in zip(group, fresh):
+                        self._cache.set(key, response)
+                        responses[index] = response
+                    continue
+            
+            for position, (index, _, notes) in enumerate(group):
+                response = self.format_executive_summary(notes)
+                if wasted is not None:
+                    response = _add_wasted_share(response, wasted, position, len(group))
+                responses[index] = response
+        
+        return [responses[index] for index in range(len(raw_notes_list))]
+    
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count the tokens of a text for the brain's model.
+        
+        Uses tiktoken when it is installed and the brain's own estimate
+        otherwise. Counts are cached by content hash, so repeated texts
+        (like the system prompt) are only tokenized once.
+        
+        Args:
+            text: The text to measure
+            
+        Returns:
+            int: Token count
+        """
+        model = self.brain.model
+        cache_key = (model, hashlib.sha256(text.encode('utf-8')).digest())
+        with _token_counts_lock:
+            count = _token_counts.get(cache_key)
+            if count is not None:
+                _token_counts.move_to_end(cache_key)
+                return count
+        
+        tokenizer = _get_tokenizer(model)
+        if tokenizer is not None:
+            count = len(tokenizer.encode(text))
+        else:
+            count = self.brain.calculate_simulated_cost(text)[0]
+        
+        with _token_counts_lock:
+            _token_counts[cache_key] = count
+            if len(_token_counts) > TOKEN_COUNT_CACHE_SIZE:
+                _token_counts.popitem(last=False)
+        return count
     
     def polish_and_publish(
         self, 
@@ -200,11 +652,23 @@ Use professional business language suitable for C-level executives."""
         Execute the full writing workflow.
         
         Workflow:
-            1. Read raw research notes from S3
+            1. Read raw research notes from S3 (while warming up the LLM)
             2. Transform into executive summary via LLM Brain
-            3. Save polished report to S3 (in /reports/ folder)
+            3. Save polished report to S3 (in /reports/ folder) in the
+               background
             4. Return the executive summary
         
+        Summaries are also cached under the notes' S3 ETag, which is looked
+        up with a HEAD request first. If the notes have not changed since
+        they were last summarized, steps 1 and 2 are skipped entirely.
+        
+        Notes too short to summarize (see MIN_NOTE_CHARS) short-circuit
+        after step 1: no LLM call is made and no report is uploaded.
+        
+        The upload in step 3 may still be in flight when this returns; call
+        `wait_for_writes()` to block until it lands. Upload failures are not
+        raised here - they are only reported by `wait_for_writes()`.
+        
         Args:
             bucket: The S3 bucket name
             input_key: The input file key (research notes)
@@ -213,61 +677,204 @@ Use professional business language suitable for C-level executives."""
         Returns:
             str: The polished executive summary
         """
-        # Step 1: Read the research notes from S3
-        print(f"[WRITER] Reading notes from s3://{bucket}/{input_key}...")
-        raw_notes = self.read_from_s3(bucket, input_key)
-        print(f"[WRITER] Notes loaded: {len(raw_notes)} characters")
-        
-        # Step 2: Transform into executive summary
-        print("[WRITER] Polishing content with LLM Brain...")
-        response = self.format_executive_summary(raw_notes)
-        executive_summary = response.text
-        
-        print(f"[WRITER] Transformation complete. Tokens used: {response.estimated_tokens}")
-        print(f"[WRITER] Simulated cost: ${response.simulated_cost:.6f}")
-        
-        # Step 3: Save executive summary to S3
-        print(f"[WRITER] Saving report to s3://{bucket}/{output_key}...")
-        
-        # Format the output with metadata header
-        report_content = f"""{'=' * 70}
-EXECUTIVE SUMMARY
-Generated by: Writer Agent | Budget-Aware AI Squad
-{'=' * 70}
-
-{executive_summary}
-
-{'=' * 70}
-DOCUMENT METADATA
-{'=' * 70}
-Source: s3://{bucket}/{input_key}
-Output: s3://{bucket}/{output_key}
-Tokens Used: {response.estimated_tokens}
-Generation Cost: ${response.simulated_cost:.6f}
-Cost Rate: $0.015 per 1,000 tokens
-{'=' * 70}
-"""
-        self.write_to_s3(bucket, output_key, report_content)
+        # Status lines are buffered and written in batches: once before the
+        # (slow) LLM call and once on the way out, even on failure
+        log_lines: list[str] = []
+        log = log_lines.append
+        
+        try:
+            # Step 1: Read the research notes from S3 while the LLM warms up,
+            # unless a summary of this exact version of them is cached
+            log(f"[WRITER] Reading notes from s3://{bucket}/{input_key}...")
+            etag = self._notes_etag(bucket, input_key)
+            response = self._cache.get(self._etag_cache_key(etag))
+            
+            if response is not None:
+                log(f"[WRITER] Notes unchanged (ETag {etag}). Reusing cached summary.")
+            else:
+                notes_future = self._io_pool.submit(self._read_with_meta, bucket, input_key)
+                self._io_pool.submit(self.brain.ensure_session)
+                raw_notes, notes_bytes, etag = notes_future.result()
+                
+                # Forecast from what will actually be sent, not the download
+                compact_notes = _compact_notes(raw_notes)
+                sent_notes = _truncate_notes(compact_notes)
+                log(f"[WRITER] Notes loaded: {notes_bytes} bytes "
+                    f"(~{self.forecast_input_tokens(sent_notes)} input tokens)")
+                
+                if not _has_substance(compact_notes):
+                    log("[WRITER] Notes too short to summarize. Skipping LLM call and report upload.")
+                    return EMPTY_NOTES_SUMMARY
+                
+                if len(sent_notes) < len(compact_notes):
+                    log(f"[WRITER] Notes exceed {MAX_INPUT_TOKENS} tokens. Truncating to fit.")
+                
+                # Step 2: Transform into executive summary
+                log("[WRITER] Polishing content with LLM Brain...")
+                _flush_log(log_lines)
+                response = self.format_executive_summary(raw_notes)
+                
+                # Cache under the ETag of the version actually read, which
+                # differs from the HEAD's if the notes changed in between
+                self._cache.set(self._etag_cache_key(etag), response)
+                
+                log(f"[WRITER] Transformation complete. Tokens used: {response.estimated_tokens} "
+                    f"({response.cached_tokens} replayed from cache)")
+                log(f"[WRITER] Simulated cost: ${response.simulated_cost:.6f}")
+            
+            executive_summary = response.text
+            
+            # Step 3: Save executive summary to S3
+            log(f"[WRITER] Saving report to s3://{bucket}/{output_key}...")
+            
+            report_content = _build_report(bucket, input_key, output_key, response)
+            self._submit_write(bucket, output_key, report_content)
+        finally:
+            _flush_log(log_lines)
         
         return executive_summary
     
+    def polish_and_publish_batch(
+        self, 
+        bucket: str, 
+        input_keys: list[str], 
+        output_keys: list[str]
+    ) -> list[str]:
+        """
+        Execute the writing workflow for several notes at once.
+        
+        All notes are downloaded concurrently, summarized together via
+        `format_executive_summaries` (one LLM call per `generate_batched`
+        batch rather than one per item), and the reports are uploaded
+        concurrently in the background. A single item takes the regular
+        `polish_and_publish` path.
+        
+        As with `polish_and_publish`, notes too short to summarize get no
+        report, and upload failures are only reported by `wait_for_writes()`.
+        
+        Args:
+            bucket: The S3 bucket name
+            input_keys: The input file keys (research notes)
+            output_keys: The output file keys, one per input key
+            
+        Returns:
+            list[str]: The executive summaries, in input order
+            
+        Raises:
+            ValueError: If the key lists differ in length
+        """
+        if len(input_keys) != len(output_keys):
+            raise ValueError("input_keys and output_keys must have the same length")
+        if len(input_keys) == 1:
+            return [self.polish_and_publish(bucket, input_keys[0], output_keys[0])]
+        
+        log_lines: list[str] = []
+        log = log_lines.append
+        
+        try:
+            # Step 1: Read every set of notes concurrently while the LLM warms up
+            log(f"[WRITER] Reading {len(input_keys)} notes from s3://{bucket}/...")
+            notes_futures = [
+                self._io_pool.submit(self.read_from_s3, bucket, key) for key in input_keys
+            ]
+            self._io_pool.submit(self.brain.ensure_session)
+            raw_notes_list = [future.result() for future in notes_futures]
+            
+            # Step 2: Summarize them together
+            log("[WRITER] Polishing content with LLM Brain (batched)...")
+            _flush_log(log_lines)
+            responses = self.format_executive_summaries(raw_notes_list)
+            
+            log(f"[WRITER] Transformation complete. Tokens used: "
+                f"{sum(response.estimated_tokens for response in responses)} "
+                f"({sum(response.cached_tokens for response in responses)} replayed from cache)")
+            log(f"[WRITER] Simulated cost: "
+                f"${sum(response.simulated_cost for response in responses):.6f}")
+            
+            # Step 3: Save each report to S3 in the background
+            for raw_notes, input_key, output_key, response in zip(
+                raw_notes_list, input_keys, output_keys, responses
+            ):
+                if not _has_substance(_compact_notes(raw_notes)):
+                    log(f"[WRITER] Notes in {input_key} too short to summarize. Skipping report upload.")
+                    continue
+                log(f"[WRITER] Saving report to s3://{bucket}/{output_key}...")
+                report_content = _build_report(bucket, input_key, output_key, response)
+                self._submit_write(bucket, output_key, report_content)
+        finally:
+            _flush_log(log_lines)
+        
+        return [response.text for response in responses]
+    
+    def forecast_input_tokens(self, notes: str) -> int:
+        """
+        Forecast the input tokens of summarizing some notes.
+        
+        Pass the notes as they will be sent - after compaction and
+        truncation to MAX_NOTE_CHARS. Each part of the request is measured
+        with `_count_tokens`, so the system prompt and template are only
+        tokenized once per process and the full prompt is never built just
+        to be measured.
+        
+        Args:
+            notes: The notes sent to the LLM
+            
+        Returns:
+            int: Estimated input tokens (system prompt + prompt + notes)
+        """
+        return sum(map(self._count_tokens, (self.system_prompt, PROMPT_PREFIX, notes, PROMPT_SUFFIX)))
+    
+    def _submit_write(self, bucket: str, key: str, content: bytearray) -> None:
+        """
+        Upload a report in the background.
+        
+        Uploads that already succeeded are forgotten here, so a long-lived
+        Writer does not accumulate futures; failed ones are kept until
+        `wait_for_writes()` reports them.
+        """
+        self._pending_writes = [
+            future for future in self._pending_writes
+            if not future.done() or future.exception() is not None
+        ]
+        self._pending_writes.append(
+            self._io_pool.submit(self.write_to_s3, bucket, key, content)
+        )
+    
+    def wait_for_writes(self) -> None:
+        """
+        Block until every background report upload has finished.
+        
+        Raises:
+            Exception: The first upload failure, after all uploads settle
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        errors = []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+    
     def get_session_cost(self) -> float:
         """
         Get the total simulated cost for this session.
         
-        Cost is calculated at $0.015 per 1,000 tokens.
+        Cost is calculated at $0.015 per 1,000 tokens. Only spend since
+        this Writer was created is counted, even when the brain is shared.
         
         Returns:
             float: Total cost in dollars
         """
-        return self.brain.total_cost_incurred
+        return self.brain.total_cost_incurred - self._cost_at_start
     
-    def get_fiscal_summary(self) -> dict:
+    def get_fiscal_summary(self) -> FiscalSummary:
         """
         Get the fiscal summary from the LLM Brain.
         
         Returns:
-            dict: Fiscal metrics including tokens and costs
+            FiscalSummary: Fiscal metrics including tokens and costs
         """
         return self.brain.get_fiscal_summary()
 
@@ -293,6 +900,7 @@ if __name__ == "__main__":
         # Execute the writing workflow
         print("\n[STARTING WRITING WORKFLOW]\n")
         summary = writer.polish_and_publish()
+        writer.wait_for_writes()
         
         # Success output
         print("\n" + "=" * 60)
@@ -305,9 +913,9 @@ if __name__ == "__main__":
         
         # Fiscal summary with cost tracking
         fiscal = writer.get_fiscal_summary()
-        print(f"\nSession Cost: ${fiscal['total_cost_incurred']:.6f}")
-        print(f"Total Tokens: {fiscal['total_tokens_used']}")
-        print(f"Cost Rate: ${fiscal['cost_per_1k_tokens']}/1k tokens")
+        print(f"\nSession Cost: ${fiscal.total_cost_incurred:.6f}")
+        print(f"Total Tokens: {fiscal.total_tokens_used}")
+        print(f"Cost Rate: ${fiscal.cost_per_1k_tokens}/1k tokens")
         
     except FileNotFoundError as e:
         print(f"\n[ERROR] {e}")